@@ -45,6 +45,14 @@ def sync_database(
     yield Database(**astra_db_credentials_kwargs)
 
 
+@pytest.fixture(scope="module")
+def sync_database_wrong_ns(
+    sync_database: Database,
+) -> Iterable[Database]:
+    """A copy of sync_database with a bogus namespace, to test overrides."""
+    yield sync_database._copy(namespace="...")
+
+
 @pytest.fixture(scope="function")
 def async_database(
     sync_database: Database,
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pytest
-
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import httpx
+import pytest
 
 from ..conftest import (
     AstraDBCredentials,
@@ -28,33 +31,112 @@ from astrapy.info import (
     DatabaseInfo,
 )
 from astrapy.constants import DefaultIdType, VectorMetric
+from astrapy.exceptions import DataAPIResponseException
 from astrapy.ids import ObjectId, UUID
 from astrapy import Collection, Database
 
+ID_TEST_COLLECTION_NAME_ROOT = "id_type_test_"
+TEST_LIFECYCLE_COLLECTION_NAME = "test_local_coll"
+TEST_LIFECYCLE_COLLECTION_NAME_B = "test_local_coll_b"
+# Data API error codes signaling a transient DDL conflict or throttling
+DDL_TRANSIENT_ERROR_CODES = {"CONCURRENCY_FAILURE", "TOO_MANY_REQUESTS"}
+
+
+def _create_with_backoff(
+    db: Database,
+    name: str,
+    *,
+    max_wait: float = 4.0,
+    **kwargs: Any,
+) -> Collection:
+    """
+    Create a collection, retrying with exponential backoff as long as the
+    API reports a DDL conflict or throttling (up to about `max_wait` seconds).
+    Any other error is raised right away.
+    """
+    delay = 0.1
+    waited = 0.0
+    while True:
+        try:
+            collection: Collection = db.create_collection(name, **kwargs)
+            return collection
+        except DataAPIResponseException as exc:
+            error_codes = {
+                descriptor.error_code for descriptor in exc.error_descriptors
+            }
+            if not (error_codes & DDL_TRANSIENT_ERROR_CODES) or waited >= max_wait:
+                raise
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code not in {409, 429} or waited >= max_wait:
+                raise
+        time.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, 1.0)
+
+
+@pytest.fixture(scope="function")
+def lifecycle_collections(
+    sync_database: Database,
+) -> Iterable[Tuple[Collection, Collection, Dict[str, CollectionDescriptor]]]:
+    """
+    A vector and a non-vector collection, with their descriptors (by name)
+    as listed right after creating them. The test is expected to drop the
+    first one, while the second is dropped here on teardown.
+    """
+    col1 = sync_database.create_collection(
+        TEST_LIFECYCLE_COLLECTION_NAME,
+        dimension=123,
+        metric=VectorMetric.EUCLIDEAN,
+        indexing={"deny": ["a", "b", "c"]},
+    )
+    col_b = sync_database.create_collection(
+        TEST_LIFECYCLE_COLLECTION_NAME_B,
+        indexing={"allow": ["z"]},
+    )
+    lifecycle_names = {
+        TEST_LIFECYCLE_COLLECTION_NAME,
+        TEST_LIFECYCLE_COLLECTION_NAME_B,
+    }
+    descriptors_by_name: Dict[str, CollectionDescriptor] = {}
+    for descriptor in sync_database.list_collections():
+        if descriptor.name in lifecycle_names:
+            descriptors_by_name[descriptor.name] = descriptor
+            if len(descriptors_by_name) == len(lifecycle_names):
+                break
+    yield col1, col_b, descriptors_by_name
+
+    sync_database.drop_collection(TEST_LIFECYCLE_COLLECTION_NAME_B)
+
+
+@pytest.fixture(scope="module")
+def baseline_count(
+    sync_database: Database,
+    sync_collection: Collection,
+) -> Iterable[int]:
+    """Document count of sync_collection, through a database-level command."""
+    cmd = sync_database.command(
+        {"countDocuments": {}}, collection_name=sync_collection.name
+    )
+    assert isinstance(cmd, dict)
+    assert isinstance(cmd["status"]["count"], int)
+    yield cmd["status"]["count"]
+
 
 class TestDDLSync:
+    @pytest.mark.xdist_group("ddl_sync")
     @pytest.mark.describe("test of collection creation, get, and then drop, sync")
     def test_collection_lifecycle_sync(
         self,
         sync_database: Database,
+        lifecycle_collections: Tuple[
+            Collection, Collection, Dict[str, CollectionDescriptor]
+        ],
     ) -> None:
-        TEST_LOCAL_COLLECTION_NAME = "test_local_coll"
-        TEST_LOCAL_COLLECTION_NAME_B = "test_local_coll_b"
-        col1 = sync_database.create_collection(
-            TEST_LOCAL_COLLECTION_NAME,
-            dimension=123,
-            metric=VectorMetric.EUCLIDEAN,
-            indexing={"deny": ["a", "b", "c"]},
-        )
-        sync_database.create_collection(
-            TEST_LOCAL_COLLECTION_NAME_B,
-            indexing={"allow": ["z"]},
-        )
-        lc_response = list(sync_database.list_collections())
+        col1, _, descriptors_by_name = lifecycle_collections
         #
         expected_coll_descriptor = CollectionDescriptor.from_dict(
             {
-                "name": TEST_LOCAL_COLLECTION_NAME,
+                "name": TEST_LIFECYCLE_COLLECTION_NAME,
                 "options": {
                     "vector": {
                         "dimension": 123,
@@ -66,26 +148,30 @@ class TestDDLSync:
         )
         expected_coll_descriptor_b = CollectionDescriptor.from_dict(
             {
-                "name": TEST_LOCAL_COLLECTION_NAME_B,
+                "name": TEST_LIFECYCLE_COLLECTION_NAME_B,
                 "options": {
                     "indexing": {"allow": ["z"]},
                 },
             },
         )
-        assert expected_coll_descriptor in lc_response
-        assert expected_coll_descriptor_b in lc_response
+        assert (
+            descriptors_by_name.get(TEST_LIFECYCLE_COLLECTION_NAME)
+            == expected_coll_descriptor
+        )
+        assert (
+            descriptors_by_name.get(TEST_LIFECYCLE_COLLECTION_NAME_B)
+            == expected_coll_descriptor_b
+        )
         #
-        col2 = sync_database.get_collection(TEST_LOCAL_COLLECTION_NAME)
+        col2 = sync_database.get_collection(TEST_LIFECYCLE_COLLECTION_NAME)
         assert col1 == col2
-        dc_response = sync_database.drop_collection(TEST_LOCAL_COLLECTION_NAME)
+        dc_response = sync_database.drop_collection(TEST_LIFECYCLE_COLLECTION_NAME)
         assert dc_response == {"ok": 1}
-        dc_response2 = sync_database.drop_collection(TEST_LOCAL_COLLECTION_NAME)
-        assert dc_response2 == {"ok": 1}
-        sync_database.drop_collection(TEST_LOCAL_COLLECTION_NAME_B)
 
     @pytest.mark.skipif(
         not is_vector_service_available(), reason="No 'service' on this database"
     )
+    @pytest.mark.xdist_group("ddl_sync")
     @pytest.mark.describe("test of collection lifecycle with service, sync")
     def test_collection_service_lifecycle_sync(
         self,
@@ -113,72 +199,42 @@ class TestDDLSync:
         vs_coll2.insert_one({}, vectorize="Silly insertion")
         vs_coll2.drop()
 
+    @pytest.mark.parametrize(
+        "collection_suffix,id_type,py_type,version",
+        [
+            ("uuid", DefaultIdType.UUID, UUID, None),
+            ("uuidv6", DefaultIdType.UUIDV6, UUID, 6),
+            ("uuidv7", DefaultIdType.UUIDV7, UUID, 7),
+            ("default", DefaultIdType.DEFAULT, None, None),
+            ("objectid", DefaultIdType.OBJECTID, ObjectId, None),
+        ],
+    )
     @pytest.mark.describe("test of default_id_type in creating collections, sync")
     def test_collection_default_id_type_sync(
         self,
         sync_database: Database,
+        collection_suffix: str,
+        id_type: str,
+        py_type: Optional[type],
+        version: Optional[int],
     ) -> None:
-        ID_TEST_COLLECTION_NAME_ROOT = "id_type_test_"
-
-        col = sync_database.create_collection(
-            ID_TEST_COLLECTION_NAME_ROOT + DefaultIdType.UUID,
-            default_id_type=DefaultIdType.UUID,
+        col = _create_with_backoff(
+            sync_database,
+            ID_TEST_COLLECTION_NAME_ROOT + collection_suffix,
+            default_id_type=id_type,
         )
-        assert col.options().default_id.default_id_type == DefaultIdType.UUID
-        i1res = col.insert_one({"role": "probe"})
-        assert isinstance(i1res.inserted_id, UUID)
-        doc = col.find_one({})
-        assert isinstance(doc["_id"], UUID)
-        col.drop()
-
-        time.sleep(2)
-        col = sync_database.create_collection(
-            ID_TEST_COLLECTION_NAME_ROOT + DefaultIdType.UUIDV6,
-            default_id_type=DefaultIdType.UUIDV6,
-        )
-        assert col.options().default_id.default_id_type == DefaultIdType.UUIDV6
-        i1res = col.insert_one({"role": "probe"})
-        assert isinstance(i1res.inserted_id, UUID)
-        assert i1res.inserted_id.version == 6
-        doc = col.find_one({})
-        assert isinstance(doc["_id"], UUID)
-        assert doc["_id"].version == 6
-        col.drop()
-
-        time.sleep(2)
-        col = sync_database.create_collection(
-            ID_TEST_COLLECTION_NAME_ROOT + DefaultIdType.UUIDV7,
-            default_id_type=DefaultIdType.UUIDV7,
-        )
-        assert col.options().default_id.default_id_type == DefaultIdType.UUIDV7
-        i1res = col.insert_one({"role": "probe"})
-        assert isinstance(i1res.inserted_id, UUID)
-        assert i1res.inserted_id.version == 7
-        doc = col.find_one({})
-        assert isinstance(doc["_id"], UUID)
-        assert doc["_id"].version == 7
-        col.drop()
-
-        time.sleep(2)
-        col = sync_database.create_collection(
-            ID_TEST_COLLECTION_NAME_ROOT + DefaultIdType.DEFAULT,
-            default_id_type=DefaultIdType.DEFAULT,
-        )
-        assert col.options().default_id.default_id_type == DefaultIdType.DEFAULT
-        col.drop()
-
-        time.sleep(2)
-        col = sync_database.create_collection(
-            ID_TEST_COLLECTION_NAME_ROOT + DefaultIdType.OBJECTID,
-            default_id_type=DefaultIdType.OBJECTID,
-        )
-        assert col.options().default_id.default_id_type == DefaultIdType.OBJECTID
-        i1res = col.insert_one({"role": "probe"})
-        assert isinstance(i1res.inserted_id, ObjectId)
-        doc = col.find_one({})
-        assert isinstance(doc["_id"], ObjectId)
+        default_id_options = col.options().default_id
+        assert default_id_options is not None
+        assert default_id_options.default_id_type == id_type
+        if py_type is not None:
+            i1res = col.insert_one({"role": "probe"})
+            assert isinstance(i1res.inserted_id, py_type)
+            if version is not None:
+                assert isinstance(i1res.inserted_id, UUID)
+                assert i1res.inserted_id.version == version
         col.drop()
 
+    @pytest.mark.xdist_group("ddl_sync")
     @pytest.mark.describe("test of collection drop, sync")
     def test_collection_drop_sync(self, sync_database: Database) -> None:
         col = sync_database.create_collection(
@@ -197,17 +253,19 @@ class TestDDLSync:
         assert isinstance(sync_database.id, str)
         assert isinstance(sync_database.name(), str)
         assert sync_database.namespace == astra_db_credentials_kwargs["namespace"]
-        assert isinstance(sync_database.info(), DatabaseInfo)
-        assert isinstance(sync_database.info().raw_info, dict)
+        info = sync_database.info()
+        assert isinstance(info, DatabaseInfo)
+        assert isinstance(info.raw_info, dict)
 
     @pytest.mark.describe("test of collection metainformation, sync")
     def test_get_collection_info_sync(
         self,
         sync_collection: Collection,
     ) -> None:
+        namespace = sync_collection.namespace
         info = sync_collection.info()
-        assert info.namespace == sync_collection.namespace
-        assert info.namespace == sync_collection._astra_db_collection.astra_db.namespace
+        assert info.namespace == namespace
+        assert namespace == sync_collection._astra_db_collection.astra_db.namespace
 
     @pytest.mark.describe("test of Database list_collections, sync")
     def test_database_list_collections_sync(
@@ -242,6 +300,7 @@ class TestDDLSync:
     @pytest.mark.skipif(
         ASTRA_DB_SECONDARY_KEYSPACE is None, reason="No secondary keyspace provided"
     )
+    @pytest.mark.xdist_group("ddl_sync")
     @pytest.mark.describe("test of cross-namespace collection lifecycle, sync")
     def test_collection_namespace_sync(
         self,
@@ -255,64 +314,61 @@ class TestDDLSync:
             astra_db_credentials_kwargs["token"],
             namespace=ASTRA_DB_SECONDARY_KEYSPACE,
         )
-        sync_database.create_collection(
-            TEST_LOCAL_COLLECTION_NAME1,
-            namespace=ASTRA_DB_SECONDARY_KEYSPACE,
-        )
-        col2_on_secondary = sync_database.create_collection(
-            TEST_LOCAL_COLLECTION_NAME2,
-            namespace=ASTRA_DB_SECONDARY_KEYSPACE,
-        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            _, col2_on_secondary = executor.map(
+                lambda name: sync_database.create_collection(
+                    name,
+                    namespace=ASTRA_DB_SECONDARY_KEYSPACE,
+                ),
+                [TEST_LOCAL_COLLECTION_NAME1, TEST_LOCAL_COLLECTION_NAME2],
+            )
         assert (
             TEST_LOCAL_COLLECTION_NAME1 in database_on_secondary.list_collection_names()
         )
-        database_on_secondary.drop_collection(TEST_LOCAL_COLLECTION_NAME1)
-        sync_database.drop_collection(col2_on_secondary)
-        assert (
-            TEST_LOCAL_COLLECTION_NAME1
-            not in database_on_secondary.list_collection_names()
-        )
-        assert (
-            TEST_LOCAL_COLLECTION_NAME2
-            not in database_on_secondary.list_collection_names()
-        )
+        # drop by name and by Collection instance, concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            drop_futures = [
+                executor.submit(
+                    database_on_secondary.drop_collection, TEST_LOCAL_COLLECTION_NAME1
+                ),
+                executor.submit(sync_database.drop_collection, col2_on_secondary),
+            ]
+        for drop_future in drop_futures:
+            drop_future.result()
+        remaining = set(database_on_secondary.list_collection_names())
+        assert TEST_LOCAL_COLLECTION_NAME1 not in remaining
+        assert TEST_LOCAL_COLLECTION_NAME2 not in remaining
 
-    @pytest.mark.describe("test of database command targeting collection, sync")
-    def test_database_command_on_collection_sync(
+    @pytest.mark.parametrize("command_target", ["database", "collection"])
+    @pytest.mark.describe("test of countDocuments command on collection, sync")
+    def test_collection_count_command_sync(
         self,
-        sync_database: Database,
+        sync_database_wrong_ns: Database,
         sync_collection: Collection,
+        baseline_count: int,
+        command_target: str,
     ) -> None:
-        cmd1 = sync_database.command(
-            {"countDocuments": {}}, collection_name=sync_collection.name
-        )
-        assert isinstance(cmd1, dict)
-        assert isinstance(cmd1["status"]["count"], int)
-        cmd2 = sync_database._copy(namespace="...").command(
-            {"countDocuments": {}},
-            namespace=sync_collection.namespace,
-            collection_name=sync_collection.name,
-        )
-        assert cmd2 == cmd1
+        if command_target == "database":
+            cmd = sync_database_wrong_ns.command(
+                {"countDocuments": {}},
+                namespace=sync_collection.namespace,
+                collection_name=sync_collection.name,
+            )
+        else:
+            cmd = sync_collection.command({"countDocuments": {}})
+        assert isinstance(cmd, dict)
+        assert cmd["status"]["count"] == baseline_count
 
     @pytest.mark.describe("test of database command, sync")
     def test_database_command_sync(
         self,
         sync_database: Database,
+        sync_database_wrong_ns: Database,
     ) -> None:
         cmd1 = sync_database.command({"findCollections": {}})
         assert isinstance(cmd1, dict)
         assert isinstance(cmd1["status"]["collections"], list)
-        cmd2 = sync_database._copy(namespace="...").command(
+        cmd2 = sync_database_wrong_ns.command(
             {"findCollections": {}}, namespace=sync_database.namespace
         )
         assert cmd2 == cmd1
-
-    @pytest.mark.describe("test of database command, sync")
-    def test_collection_command_sync(
-        self,
-        sync_collection: Collection,
-    ) -> None:
-        cmd1 = sync_collection.command({"countDocuments": {}})
-        assert isinstance(cmd1, dict)
-        assert isinstance(cmd1["status"]["count"], int)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import pytest
+from pytest_httpserver import HTTPServer
 
 from ..conftest import (
     AstraDBCredentials,
@@ -158,6 +159,20 @@ class TestDatabasesSync:
         )
         assert db3 == db1
 
+    @pytest.mark.describe("test of Database drop_collection request/response, sync")
+    def test_database_drop_collection_response_sync(
+        self,
+        httpserver: HTTPServer,
+    ) -> None:
+        root_endpoint = httpserver.url_for("/")
+        db1 = Database(api_endpoint=root_endpoint, token="token", namespace="ns")
+        httpserver.expect_oneshot_request(
+            db1._astra_db.base_path,
+            method="POST",
+            json={"deleteCollection": {"name": "dropped_coll"}},
+        ).respond_with_json({"status": {"ok": 1}})
+        assert db1.drop_collection("dropped_coll") == {"ok": 1}
+
     @pytest.mark.describe("test of Database set_caller, sync")
     def test_database_set_caller_sync(
         self,